@@ -1,15 +1,58 @@
 #!/usr/bin/env python3
 """Shared readiness checker for plugins and modules."""
 
+import ast
+import importlib.util
 import sys
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
-# Add shared directory to path
-sys.path.insert(0, str(Path(__file__).parent))
+# Add shared directory to path (once, even if this module is loaded again)
+_SHARED_DIR = str(Path(__file__).parent)
+if _SHARED_DIR not in sys.path:
+    sys.path.insert(0, _SHARED_DIR)
 from readiness_base import ReadinessChecker
 
 
+def _find_class(source_file: Path, class_name: str) -> Optional[bool]:
+    """Look for a top-level class definition without executing the file.
+    
+    Returns None when the name is bound some other way (import, assignment,
+    conditional definition) and only importing the file can tell.
+    """
+    tree = ast.parse(source_file.read_bytes(), filename=str(source_file))
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and node.name == class_name:
+            return True
+    
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            for alias in node.names:
+                bound = alias.asname or alias.name.split(".")[0]
+                if alias.name == "*" or bound == class_name:
+                    return None
+        elif isinstance(node, ast.Name) and node.id == class_name and isinstance(node.ctx, ast.Store):
+            return None
+        elif isinstance(node, ast.ClassDef) and node.name == class_name:
+            return None
+    return False
+
+
+def _import_has_class(source_dir: Path, module_name: str, source_file: Path, class_name: str) -> bool:
+    """Execute the file and check that it exposes the class."""
+    sys.path.insert(0, str(source_dir))
+    try:
+        spec = importlib.util.spec_from_file_location(module_name, source_file)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Could not load module spec for {source_file.name}")
+        
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return hasattr(module, class_name)
+    finally:
+        sys.path.remove(str(source_dir))
+
+
 def create_plugin_checker(plugin_dir: Path, plugin_name: str) -> ReadinessChecker:
     """Create readiness checker for a plugin."""
     checker = ReadinessChecker(f"{plugin_name.upper()} Plugin", plugin_dir)
@@ -23,9 +66,7 @@ def create_plugin_checker(plugin_dir: Path, plugin_name: str) -> ReadinessChecke
         
         # Additional plugin-specific validation
         try:
-            import yaml
-            with open(manifest_file, 'r') as f:
-                manifest = yaml.safe_load(f)
+            manifest = checker.load_yaml(manifest_file)
             
             plugin_class = manifest.get("plugin_class", "")
             if ":" not in plugin_class:
@@ -37,9 +78,7 @@ def create_plugin_checker(plugin_dir: Path, plugin_name: str) -> ReadinessChecke
     
     def check_plugin_file():
         try:
-            import yaml
-            with open(plugin_dir / "manifest.yaml", 'r') as f:
-                manifest = yaml.safe_load(f)
+            manifest = checker.load_yaml(plugin_dir / "manifest.yaml")
             
             plugin_class = manifest.get("plugin_class", "")
             module_name, class_name = plugin_class.split(":", 1)
@@ -48,23 +87,15 @@ def create_plugin_checker(plugin_dir: Path, plugin_name: str) -> ReadinessChecke
             if not plugin_file.exists():
                 return False, f"Plugin file {module_name}.py not found"
             
-            # Try basic import test
-            sys.path.insert(0, str(plugin_dir))
-            try:
-                import importlib.util
-                spec = importlib.util.spec_from_file_location(module_name, plugin_file)
-                if spec is None or spec.loader is None:
-                    return False, f"Could not load module spec for {module_name}"
-                
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-                
-                if not hasattr(module, class_name):
-                    return False, f"Class {class_name} not found in {module_name}.py"
-                
-                return True, "Plugin file valid and importable"
-            finally:
-                sys.path.remove(str(plugin_dir))
+            # Scan the source first; only import when the AST is ambiguous
+            found = _find_class(plugin_file, class_name)
+            if found is None:
+                found = _import_has_class(plugin_dir, module_name, plugin_file, class_name)
+            
+            if not found:
+                return False, f"Class {class_name} not found in {module_name}.py"
+            
+            return True, f"Plugin file valid (defines {class_name})"
                 
         except Exception as e:
             return False, f"Error validating plugin file: {e}"
@@ -92,9 +123,7 @@ def create_module_checker(module_dir: Path, module_name: str) -> ReadinessChecke
         
         # Additional module-specific validation
         try:
-            import yaml
-            with open(manifest_file, 'r') as f:
-                manifest = yaml.safe_load(f)
+            manifest = checker.load_yaml(manifest_file)
             
             # Check if actions are properly defined
             actions = manifest.get("actions", [])
@@ -111,9 +140,7 @@ def create_module_checker(module_dir: Path, module_name: str) -> ReadinessChecke
     
     def check_module_file():
         try:
-            import yaml
-            with open(module_dir / "manifest.yaml", 'r') as f:
-                manifest = yaml.safe_load(f)
+            manifest = checker.load_yaml(module_dir / "manifest.yaml")
             
             module_file = manifest.get("module_file", "")
             class_name = manifest.get("class_name", "")
@@ -122,23 +149,15 @@ def create_module_checker(module_dir: Path, module_name: str) -> ReadinessChecke
             if not module_path.exists():
                 return False, f"Module file {module_file} not found"
             
-            # Try basic import test
-            sys.path.insert(0, str(module_dir))
-            try:
-                import importlib.util
-                spec = importlib.util.spec_from_file_location("module_test", module_path)
-                if spec is None or spec.loader is None:
-                    return False, f"Could not load module spec for {module_file}"
-                
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-                
-                if not hasattr(module, class_name):
-                    return False, f"Class {class_name} not found in {module_file}"
-                
-                return True, "Module file valid and importable"
-            finally:
-                sys.path.remove(str(module_dir))
+            # Scan the source first; only import when the AST is ambiguous
+            found = _find_class(module_path, class_name)
+            if found is None:
+                found = _import_has_class(module_dir, "module_test", module_path, class_name)
+            
+            if not found:
+                return False, f"Class {class_name} not found in {module_file}"
+            
+            return True, f"Module file valid (defines {class_name})"
                 
         except Exception as e:
             return False, f"Error validating module file: {e}"
@@ -2,14 +2,29 @@
 """Base class for readiness checks to reduce code duplication."""
 
 import argparse
+import importlib.util
 import json
 import os
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, List, Callable, Tuple
 
 
+@lru_cache(maxsize=None)
+def _try_import(module_name: str) -> bool:
+    """Check whether a module can be located; parent packages are imported.
+
+    The module itself is not executed, so an installed module whose own
+    imports fail is still reported as available.
+    """
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
 class ReadinessChecker:
     """Base class for component readiness checks."""
     
@@ -17,6 +32,7 @@ class ReadinessChecker:
         self.component_name = component_name
         self.component_dir = component_dir
         self.checks: List[Tuple[str, Callable[[], Tuple[bool, str]]]] = []
+        self._yaml_cache: Dict[Path, Any] = {}
     
     def add_check(self, name: str, check_func: Callable[[], Tuple[bool, str]]) -> None:
         """Add a check function."""
@@ -36,11 +52,25 @@ class ReadinessChecker:
     
     def check_import(self, module_name: str, package_name: str = None) -> Tuple[bool, str]:
         """Check if a module can be imported."""
-        try:
-            __import__(module_name)
+        if _try_import(module_name):
             return True, f"{package_name or module_name} available"
-        except ImportError:
-            return False, f"{package_name or module_name} not installed"
+        return False, f"{package_name or module_name} not installed"
+    
+    def load_yaml(self, file_path: Path) -> Any:
+        """Load a YAML file, preferring the libyaml C loader when available.
+        
+        Parsed documents are cached per path, so checks that read the same
+        manifest only parse it once. Callers must not mutate the result.
+        """
+        if file_path in self._yaml_cache:
+            return self._yaml_cache[file_path]
+        
+        import yaml
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        with open(file_path, 'r') as f:
+            data = yaml.load(f, Loader=loader)
+        self._yaml_cache[file_path] = data
+        return data
     
     def check_yaml_file(self, file_path: Path, required_fields: List[str] = None) -> Tuple[bool, str]:
         """Check YAML file validity."""
@@ -48,9 +78,7 @@ class ReadinessChecker:
             return False, f"{file_path.name} not found"
         
         try:
-            import yaml
-            with open(file_path, 'r') as f:
-                data = yaml.safe_load(f)
+            data = self.load_yaml(file_path)
             
             if not isinstance(data, dict):
                 return False, f"{file_path.name} must contain a dictionary"
@@ -66,9 +94,10 @@ class ReadinessChecker:
             return False, f"Error reading {file_path.name}: {e}"
     
     def run_checks(self, verbose: bool = False) -> Tuple[bool, Dict[str, Any]]:
-        """Run all registered checks."""
+        """Run all registered checks, printing their output once at the end."""
         results = {}
         all_passed = True
+        lines = []
         
         for check_name, check_func in self.checks:
             try:
@@ -83,7 +112,7 @@ class ReadinessChecker:
                     
                 if verbose or not passed:
                     status_icon = "✅" if passed else "❌"
-                    print(f"{status_icon} {check_name}: {message}")
+                    lines.append(f"{status_icon} {check_name}: {message}")
                     
             except Exception as e:
                 results[check_name] = {
@@ -93,7 +122,11 @@ class ReadinessChecker:
                 all_passed = False
                 
                 if verbose:
-                    print(f"❌ {check_name}: Check failed: {e}")
+                    lines.append(f"❌ {check_name}: Check failed: {e}")
+        
+        # Write all check lines at once rather than one print per check
+        if lines:
+            print("\n".join(lines))
         
         return all_passed, results
     
@@ -4,9 +4,13 @@
 import json
 import time
 import sys
+import threading
 import uuid
 import paho.mqtt.client as mqtt
 
+# Test commands only differ in req_id, action and timestamp
+_COMMAND_TEMPLATE = b'{"req_id":"%s","actor":"test","action":"%s","params":{},"ts":"%s"}'
+
 
 class SystemTester:
     def __init__(self, mqtt_host="192.168.1.63", mqtt_port=1883, 
@@ -18,31 +22,42 @@ class SystemTester:
         self.client.on_connect = self._on_connect
         self.client.on_message = self._on_message
         self.responses = {}
+        self._pending = {}
         self.device_status = {}
         
     def _on_connect(self, client, userdata, flags, rc):
         if rc == 0:
             print(f"✓ Connected to MQTT broker at {self.mqtt_host}:{self.mqtt_port}")
-            # Subscribe to relevant topics
-            client.subscribe("/lab/device/+/status")
-            client.subscribe("/lab/device/+/meta")
-            client.subscribe("/lab/device/+/evt")
-            client.subscribe("/lab/orchestrator/registry")
+            # Subscribe to relevant topics in a single SUBSCRIBE packet
+            client.subscribe([
+                ("/lab/device/+/status", 0),
+                ("/lab/device/+/meta", 0),
+                ("/lab/device/+/evt", 0),
+                ("/lab/orchestrator/registry", 0),
+            ])
         else:
             print(f"✗ Failed to connect to MQTT broker (code: {rc})")
             
     def _on_message(self, client, userdata, msg):
+        # Only status and evt topics are tracked; skip parsing everything else
+        prefix, _, suffix = msg.topic.rpartition("/")
+        if suffix != "status" and suffix != "evt":
+            return
+            
         try:
-            payload = json.loads(msg.payload.decode())
+            payload = json.loads(msg.payload)
             
             # Track device status
-            if "/status" in msg.topic:
-                device_id = msg.topic.split("/")[3]
+            if suffix == "status":
+                device_id = prefix.rpartition("/")[2]
                 self.device_status[device_id] = payload
                 
             # Track command responses
-            if "/evt" in msg.topic and "req_id" in payload:
+            elif "req_id" in payload:
                 self.responses[payload["req_id"]] = payload
+                event = self._pending.pop(payload["req_id"], None)
+                if event is not None:
+                    event.set()
                 
         except Exception as e:
             pass
@@ -59,77 +74,71 @@ class SystemTester:
         self.client.loop_stop()
         self.client.disconnect()
         
+    def _send_command(self, topic, req_id, action):
+        """Publish a command and register interest in its response."""
+        ts = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        payload = _COMMAND_TEMPLATE % (req_id.encode(), action.encode(), ts.encode())
+        self._pending[req_id] = threading.Event()
+        self.client.publish(topic, payload)
+        
+    def _wait_for_response(self, req_id, timeout):
+        """Block until the response for req_id arrives or timeout expires."""
+        event = self._pending.get(req_id)
+        if event is not None and not event.wait(timeout):
+            self._pending.pop(req_id, None)
+        return self.responses.get(req_id)
+        
     def test_device_ping(self, device_id="rpi-lab-01"):
         """Test device ping command."""
         print(f"\nTesting ping to device: {device_id}")
         
         req_id = str(uuid.uuid4())
-        command = {
-            "req_id": req_id,
-            "actor": "test",
-            "action": "ping",
-            "params": {},
-            "ts": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-        }
         
         # Send command
         topic = f"/lab/device/{device_id}/cmd"
-        self.client.publish(topic, json.dumps(command))
+        self._send_command(topic, req_id, "ping")
         print(f"  → Sent ping command (req_id: {req_id[:8]}...)")
         
         # Wait for response
         timeout = 5
-        start = time.time()
-        while time.time() - start < timeout:
-            if req_id in self.responses:
-                response = self.responses[req_id]
-                if response.get("ok"):
-                    print(f"  ✓ Device responded: {response.get('details', {})}")
-                else:
-                    print(f"  ✗ Device error: {response.get('error')}")
-                return True
-            time.sleep(0.1)
+        response = self._wait_for_response(req_id, timeout)
+        if response is None:
+            print(f"  ✗ No response after {timeout} seconds")
+            return False
             
-        print(f"  ✗ No response after {timeout} seconds")
-        return False
+        if response.get("ok"):
+            print(f"  ✓ Device responded: {response.get('details', {})}")
+        else:
+            print(f"  ✗ Device error: {response.get('error')}")
+        return True
         
     def test_module_status(self, device_id="rpi-lab-01", module="ndi"):
         """Test module status command."""
         print(f"\nTesting {module} module status on device: {device_id}")
         
         req_id = str(uuid.uuid4())
-        command = {
-            "req_id": req_id,
-            "actor": "test",
-            "action": "status",
-            "params": {},
-            "ts": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-        }
         
         # Send command
         topic = f"/lab/device/{device_id}/{module}/cmd"
-        self.client.publish(topic, json.dumps(command))
+        self._send_command(topic, req_id, "status")
         print(f"  → Sent status command to {module} module")
         
         # Wait for response
         timeout = 5
-        start = time.time()
-        while time.time() - start < timeout:
-            if req_id in self.responses:
-                response = self.responses[req_id]
-                if response.get("ok"):
-                    print(f"  ✓ Module responded with status")
-                    details = response.get("details", {})
-                    if details:
-                        print(f"    Current source: {details.get('current_source', 'None')}")
-                        print(f"    Processes: {details.get('processes', {})}")
-                else:
-                    print(f"  ✗ Module error: {response.get('error')}")
-                return True
-            time.sleep(0.1)
+        response = self._wait_for_response(req_id, timeout)
+        if response is None:
+            print(f"  ✗ No response after {timeout} seconds")
+            return False
             
-        print(f"  ✗ No response after {timeout} seconds")
-        return False
+        if response.get("ok"):
+            print(f"  ✓ Module responded with status")
+            details = response.get("details", {})
+            if details:
+                print(f"    Current source: {details.get('current_source', 'None')}")
+                print(f"    Processes: {details.get('processes', {})}")
+        else:
+            print(f"  ✗ Module error: {response.get('error')}")
+        return True
         
     def list_devices(self):
         """List all connected devices."""